@@ -1,12 +1,15 @@
 # Ubuntu-only stuff. Abort if not Ubuntu.
 is_mint || return 1
 
-# Update APT.
-e_header "Updating APT"
-sudo apt-get -qq update
-sudo apt-get -qq dist-upgrade
+# Let apt retry flaky downloads itself, within the same run, instead of
+# failing the whole update or install on the first dropped connection.
+apt_opts=(-qq -o Acquire::Retries=3)
 
-# Install APT packages.
+# Upgrading is slow and rarely needed more than once a day, so it's skipped if
+# it already succeeded in the last 24 hours. Delete this file to force it.
+apt_upgrade_marker="$DOTFILES/caches/init/apt_upgraded"
+
+# APT packages.
 packages=(
   ansible
   build-essential
@@ -32,15 +35,39 @@ packages=(
   irssi
 )
 
-packages=($(setdiff "${packages[*]}" "$(dpkg --get-selections | grep -v deinstall | awk '{print $1}')"))
-echo 123
-echo $packages
+# Ask dpkg about just these packages, in one query, and keep the ones that are
+# actually installed ("ii"), not merely selected for install.
+installed_packages="$(dpkg-query -W -f='${db:Status-Abbrev} ${Package}\n' "${packages[@]}" 2>/dev/null | awk '/^ii/ {print $2}')"
+packages=($(setdiff "${packages[*]}" "$installed_packages"))
 
+apt_upgraded_recently="$(find "$apt_upgrade_marker" -mmin -1440 2>/dev/null)"
+
+# Update APT. The package lists are only needed to install or upgrade, so if
+# there's nothing to do for either, skip the update (and its network round
+# trips) entirely.
+e_header "Updating APT"
+if (( ${#packages[@]} > 0 )) || [[ ! "$apt_upgraded_recently" ]]; then
+  sudo apt-get "${apt_opts[@]}" update
+else
+  e_arrow "Skipping update, there is nothing to install or upgrade."
+fi
+if [[ "$apt_upgraded_recently" ]]; then
+  e_arrow "Skipping dist-upgrade, it already ran in the last 24 hours."
+else
+  sudo apt-get "${apt_opts[@]}" dist-upgrade && touch "$apt_upgrade_marker"
+fi
+
+# Install APT packages.
 if (( ${#packages[@]} > 0 )); then
   e_header "Installing APT packages: ${packages[*]}"
-  for package in "${packages[@]}"; do
-    sudo apt-get -qq install "$package"
-  done
+  # Install everything in one transaction. If that fails (eg. a package isn't
+  # available on this release) fall back to one at a time, so the rest still
+  # get installed.
+  if ! sudo apt-get "${apt_opts[@]}" install "${packages[@]}"; then
+    for package in "${packages[@]}"; do
+      sudo apt-get "${apt_opts[@]}" install "$package"
+    done
+  fi
 fi
 
 # Install Git Extras
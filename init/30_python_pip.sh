@@ -1,5 +1,5 @@
 # Homebrew installs python2 pip as "pip2"
-for pip_cmd in pip2 pip FAIL; do [[ "$(which $pip_cmd)" ]] && break; done
+for pip_cmd in pip2 pip FAIL; do [[ "$(type -P $pip_cmd)" ]] && break; done
 
 # Exit if pip is not installed.
 [[ $pip_cmd == FAIL ]] && e_error "Pip needs to be installed." && return 1
@@ -17,9 +17,12 @@ installed_pip_packages="$($pip_cmd list 2>/dev/null | awk '{print $1}')"
 pip_packages=($(setdiff "${pip_packages[*]}" "$installed_pip_packages"))
 
 if (( ${#pip_packages[@]} > 0 )); then
-  e_header "Installing pip packages (${#pip_packages[@]})"
-  for package in "${pip_packages[@]}"; do
-    e_arrow "$package"
-    $pip_cmd install "$package"
-  done
+  e_header "Installing pip packages: ${pip_packages[*]}"
+  # Install everything in one go. If that fails (eg. one package doesn't
+  # build) fall back to one at a time, so the rest still get installed.
+  if ! $pip_cmd install "${pip_packages[@]}"; then
+    for package in "${pip_packages[@]}"; do
+      $pip_cmd install "$package"
+    done
+  fi
 fi
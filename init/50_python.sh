@@ -4,9 +4,12 @@ packages=(
     zest.releaser 
     check-manifest 
     zest.pocompile
-    checkoutmanager
     )
 
-for package in "${packages[@]}"; do
+# Install everything in one go. If that fails (eg. one package doesn't build)
+# fall back to one at a time, so the rest still get installed.
+if ! sudo pip install -U "${packages[@]}"; then
+  for package in "${packages[@]}"; do
     sudo pip install -U "$package"
-done
+  done
+fi
@@ -1,5 +1,8 @@
-# Change shell to zsh
-chsh -s /usr/bin/zsh
+# Change shell to zsh, unless it already is. $SHELL only changes at the next
+# login, so also check the passwd entry (which chsh updates right away). That
+# way a re-run in the same session skips chsh and its password prompt too.
+[[ "$SHELL" == */zsh || "$(getent passwd "$USER" 2>/dev/null)" == */zsh ]] ||
+  chsh -s /usr/bin/zsh
 
 # Symlink oy-my-zsh
 cd ~
@@ -16,3 +16,25 @@ function prompt_zero() {
   prompt_default
   PS1='$ '
 }
+
+# Exit code reset helpers, shared by the powerline prompts. Call
+# __prompt_exit_code_init, then wrap PROMPT_COMMAND in __prompt_exit_code and
+# __prompt_cleanup.
+function __prompt_exit_code_init() {
+  __prompt_stack=()
+  trap '__prompt_stack=("${__prompt_stack[@]}" "$BASH_COMMAND")' DEBUG
+}
+
+function __prompt_exit_code() {
+  local exit_code=$?
+  # If the first command in the stack is __prompt_command, no command was run.
+  # Set exit_code to 0.
+  [[ "${__prompt_stack[0]}" == "__prompt_exit_code" ]] && exit_code=0
+  # Return the (correct) exit code.
+  return $exit_code
+}
+
+function __prompt_cleanup() {
+  # Reset the stack.
+  __prompt_stack=()
+}
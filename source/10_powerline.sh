@@ -1,10 +1,12 @@
-[[ ! "$(which powerline-daemon)" ]] && return 1
-
-# Homebrew installs python2 as "python2"
-for python_cmd in python2 python FAIL; do [[ "$(which $python_cmd)" ]] && break; done
-
-# Powerline stuff.
-export POWERLINE_PREFIX="$($python_cmd -c "import powerline; print powerline.__path__[0]")"
+[[ ! "$(type -P powerline-daemon)" ]] && return 1
+
+# Powerline stuff. Asking python where powerline lives is slow, so reuse the
+# path exported by a parent shell (eg. inside tmux) if it's still valid.
+if [[ ! -e "$POWERLINE_PREFIX/bindings/bash/powerline.sh" ]]; then
+  # Homebrew installs python2 as "python2"
+  for python_cmd in python2 python FAIL; do [[ "$(type -P $python_cmd)" ]] && break; done
+  export POWERLINE_PREFIX="$($python_cmd -c "import powerline; print powerline.__path__[0]")"
+fi
 
 powerline-daemon -q
 export POWERLINE_BASH_CONTINUATION=1
@@ -15,22 +17,7 @@ unset PROMPT_COMMAND
 
 # Ensure exit code is reset when pressing "enter" with no command
 # because I'm OCD.
-__prompt_stack=()
-trap '__prompt_stack=("${__prompt_stack[@]}" "$BASH_COMMAND")' DEBUG
-
-function __prompt_exit_code() {
-  local exit_code=$?
-  # If the first command in the stack is __prompt_command, no command was run.
-  # Set exit_code to 0.
-  [[ "${__prompt_stack[0]}" == "__prompt_exit_code" ]] && exit_code=0
-  # Return the (correct) exit code.
-  return $exit_code
-}
-
-function __prompt_cleanup() {
-  # Reset the stack.
-  __prompt_stack=()
-}
+__prompt_exit_code_init
 
 PROMPT_COMMAND=$'__prompt_exit_code\n'"$PROMPT_COMMAND"$'\n__prompt_cleanup'
 
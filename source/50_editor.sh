@@ -3,7 +3,7 @@
 export VISUAL=vim
 
 # If mvim is installed, use it instead of native vim
-if [[ "$(which mvim)" ]]; then
+if [[ "$(type -P mvim)" ]]; then
     VISUAL="mvim -v"
     alias vim="$VISUAL"
 fi
@@ -15,17 +15,37 @@ function titlebar() {
   echo -n $'\e]0;'"$*"$'\a'
 }
 
-# SSH auto-completion based on entries in known_hosts.
+# SSH auto-completion based on entries in known_hosts. Building the host list
+# takes a handful of processes, so it's cached and only rebuilt when
+# known_hosts is newer than the cache. The cache is written to a temp file and
+# moved into place, so other shells starting at the same time never read a
+# half-written list. If it can't be written, the list built here is still used.
 if [[ -e ~/.ssh/known_hosts ]]; then
-  complete -o default -W "$(cat ~/.ssh/known_hosts | sed 's/[, ].*//' | sort | uniq | grep -v '[0-9]')" ssh scp sftp
+  hosts_cache="$DOTFILES/caches/ssh_hosts"
+  if [[ ~/.ssh/known_hosts -nt "$hosts_cache" || ! -r "$hosts_cache" ]]; then
+    hosts="$(sed -e 's/[, ].*//' -e '/[0-9]/d' ~/.ssh/known_hosts | sort -u)"
+    { mkdir -p "$DOTFILES/caches" &&
+      printf '%s\n' "$hosts" > "$hosts_cache.$$" &&
+      mv "$hosts_cache.$$" "$hosts_cache"; } 2>/dev/null || rm -f "$hosts_cache.$$" 2>/dev/null
+  else
+    IFS= read -rd '' hosts < "$hosts_cache"
+  fi
+  complete -o default -W "$hosts" ssh scp sftp
+  unset hosts hosts_cache
 fi
 
 # Disable ansible cows }:]
 export ANSIBLE_NOCOWS=1
 
 # "fuck"
-if [[ "$(which thefuck)" ]]; then
-  eval $(thefuck --alias)
+# "thefuck --alias" starts a Python interpreter, so only run it the first time
+# the alias is actually used instead of on every shell startup.
+if [[ "$(type -P thefuck)" ]]; then
+  function fuck() {
+    unset -f fuck
+    eval "$(thefuck --alias)"
+    eval 'fuck "$@"'
+  }
 fi
 
 # Run a command repeatedly in a loop, with a delay (defaults to 1 sec).